@@ -0,0 +1,32 @@
+# cython: boundscheck=False, wraparound=False
+"""
+Compiled board rasterizer for generate_rule_gifs.py.
+
+Optional: build in place with
+  cd scripts && python setup.py build_ext --inplace
+generate_rule_gifs.py falls back to its numba/PIL paths when the
+extension is absent.
+"""
+
+
+def rasterize_board(unsigned char[:, :, ::1] arr,
+                    const unsigned char[:, :, ::1] fills,
+                    const unsigned char[:, :, ::1] borders,
+                    int cell):
+    """Fill each cell's interior and 2px border straight into arr."""
+    cdef int rows = fills.shape[0]
+    cdef int cols = fills.shape[1]
+    cdef int r, c, y, x, k, y0, x0
+    cdef bint inside
+    for r in range(rows):
+        for c in range(cols):
+            y0 = r * cell
+            x0 = c * cell
+            for y in range(cell):
+                for x in range(cell):
+                    inside = 2 <= y < cell - 2 and 2 <= x < cell - 2
+                    for k in range(3):
+                        if inside:
+                            arr[y0 + y, x0 + x, k] = fills[r, c, k]
+                        else:
+                            arr[y0 + y, x0 + x, k] = borders[r, c, k]
@@ -6,40 +6,96 @@ Reads from benchmarks/ (experiment dirs with game.csv, final_board.txt, output.l
 import os
 import re
 import csv
+import collections
+import functools
+import itertools
+import json
+import operator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 BENCHMARKS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
 OUT_CSV = Path(__file__).resolve().parent.parent / "benchmark_results_runs.csv"
+# Log-scan manifest written by scan_logs.py: output.log path -> metrics+mtime
+MANIFEST_PATH = Path(__file__).resolve().parent.parent / "benchmark_results_logscan.json"
 
+# Compiled once at import; the helpers below run per-experiment over the whole tree.
+_RE_LETTERS = re.compile(r"[A-Za-z]+")
+_RE_WORD_LINE = re.compile(r"^([A-Za-z]+)\s")
+_RE_SCORE = re.compile(r":\s*(\d+)\s*$")
+# API/connection/rate-limit infrastructure errors; recorded here so
+# clean_benchmark_csv.py never has to re-open output.log (same patterns).
+# Bytes pattern: output.log is scanned undecoded (see analyze_output_log).
+_RE_API_ERROR = re.compile(
+    rb"(\[unavailable\]|ENOTFOUND|Connection stalled|\[resource_exhausted\]|getaddrinfo)",
+    re.IGNORECASE,
+)
+# Every output.log marker the analyzer cares about; each gets its own
+# C-level substring scan over the undecoded bytes.
+_LOG_MARKERS = (
+    "timed out after", "Could not parse", "❌ INVALID MOVE:", " START ===",
+    "[agent mode]", "[ask mode]", "GAME OVER", "Board is full",
+    "Max rounds reached", "consecutive failures",
+)
 
-def get_initial_word(exp_dir: Path) -> str:
-    """From game.csv first row with initial_word, or from board/final_board grid."""
-    game_csv = exp_dir / "game.csv"
-    if game_csv.exists():
-        with open(game_csv) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                w = (row.get("initial_word") or "").strip()
-                if w:
-                    return w
-    # Fallback: first sequence of letters from board/final
+
+def _scan_markers(content: bytes):
+    """Count _LOG_MARKERS in the log and record each marker's first offset.
+
+    Returns (counts, first_pos), both keyed by the marker string.
+    """
+    counts = {}
+    first = {}
+    for kw in _LOG_MARKERS:
+        raw = kw.encode("utf-8")
+        pos = content.find(raw)
+        if pos != -1:
+            first[kw] = pos
+            counts[kw] = content.count(raw)
+    return counts, first
+
+# Output column order; process_experiment returns tuples in this order.
+FIELDNAMES = (
+    "Model", "Tool", "Mode", "Field size", "Turn limit", "Iteration",
+    "Score", "Rounds", "Invalid errors", "Timeout errors", "Parse errors",
+    "API error", "Word", "Words", "Status", "Benchmark",
+)
+
+
+def get_initial_word(files: dict) -> str:
+    """From game.csv first row with initial_word, or from board/final_board grid.
+
+    `files` maps filename -> Path for the experiment dir (from one scandir).
+    """
+    game_csv = files.get("game.csv")
+    if game_csv:
+        with open(game_csv, newline="") as f:
+            # Raw reader + column index: no per-row dict allocation, and the
+            # word is almost always in the first data row.
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header and "initial_word" in header:
+                idx = header.index("initial_word")
+                for row in reader:
+                    if len(row) > idx and row[idx].strip():
+                        return row[idx].strip()
+    # Fallback: first sequence of letters from board/final (always near the top)
     for name in ("board.txt", "final_board.txt"):
-        p = exp_dir / name
-        if p.exists():
+        p = files.get(name)
+        if p:
             with open(p) as f:
-                for line in f:
+                for line in itertools.islice(f, 8):
                     line = line.strip()
                     if line and not line.startswith("---") and "|" not in line:
-                        letters = re.findall(r"[A-Za-z]+", line)
+                        letters = _RE_LETTERS.findall(line)
                         if letters and len(letters[0]) > 1:
                             return letters[0].upper()
     return ""
 
 
-def get_words_list(exp_dir: Path) -> str:
+def get_words_list(final: Path) -> str:
     """Comma-separated list of words from final_board.txt ---WORDS--- section."""
-    final = exp_dir / "final_board.txt"
-    if not final.exists():
+    if final is None:
         return ""
     in_words = False
     words = []
@@ -53,162 +109,227 @@ def get_words_list(exp_dir: Path) -> str:
                 if not line or line.startswith("---"):
                     break
                 # "WORD (player) len (def)" -> WORD
-                m = re.match(r"^([A-Za-z]+)\s", line)
+                m = _RE_WORD_LINE.match(line)
                 if m:
                     words.append(m.group(1).upper())
     return ",".join(words)
 
 
 def get_score(final_board_path: Path) -> str:
-    """Last player score from final_board.txt (e.g. 'claude|...|180: 33' -> 33)."""
-    if not final_board_path.exists():
+    """Last player score from final_board.txt (e.g. 'claude|...|180: 33' -> 33).
+
+    The score lines live in the ---PLAYERS--- section between the grid and
+    the word list, so scan the lines backwards and return on the first
+    match instead of regex-testing every line from the top. No tail cap:
+    the file is small, and a missed window would silently report "".
+    """
+    if final_board_path is None:
         return ""
     with open(final_board_path) as f:
-        for line in f:
-            m = re.search(r":\s*(\d+)\s*$", line.strip())
-            if m:
-                last_score = m.group(1)
-    return last_score or ""
-
-
-def count_errors(output_log_path: Path) -> dict:
-    """Count timeout, parse, and invalid (wrong path/output) errors from output.log."""
-    out = {"timeout": 0, "parse": 0, "invalid": 0}
-    if not output_log_path.exists():
-        return out
-    with open(output_log_path) as f:
-        content = f.read()
-    out["timeout"] = len(re.findall(r"timed out after", content))
-    out["parse"] = len(re.findall(r"Could not parse", content))
-    out["invalid"] = len(re.findall(r"❌ INVALID MOVE:", content))
-    return out
+        lines = f.readlines()
+    for line in reversed(lines):
+        m = _RE_SCORE.search(line.strip())
+        if m:
+            return m.group(1)
+    return ""
 
 
-def count_rounds(output_log_path: Path) -> int:
-    """Number of ROUND N START in output.log."""
-    if not output_log_path.exists():
-        return 0
-    with open(output_log_path) as f:
-        content = f.read()
-    return len(re.findall(r"=== ROUND \d+ START ===", content))
-
-
-def get_status(output_log_path: Path) -> str:
-    """completed | turn_limit | consecutive_failures | interrupted."""
-    if not output_log_path.exists():
-        return "unknown"
-    with open(output_log_path) as f:
-        content = f.read()
-    if "GAME OVER" in content or "Board is full" in content:
-        return "completed"
-    if "Max rounds reached" in content:
-        return "turn_limit"
-    if "consecutive failures" in content:
-        return "consecutive_failures"
-    return "interrupted"
-
-
-def get_mode(output_log_path: Path) -> str:
-    """ask | agent from [ask mode] or [agent mode] in output.log."""
-    if not output_log_path.exists():
-        return "ask"
-    with open(output_log_path) as f:
-        for line in f:
-            if "[agent mode]" in line:
-                return "agent"
-            if "[ask mode]" in line:
-                return "ask"
-    return "ask"
+_manifest = None
+
+
+def _get_manifest():
+    """Lazy-load the scan_logs.py manifest, once per process ({} if absent)."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def analyze_output_log(output_log_path: Path) -> dict:
+    """Extract metrics from output.log: one read, then a pure content scan.
+
+    Serves from the scan_logs.py manifest when it has a current entry, so a
+    pipeline run reads each log at most once. Returns a dict with keys
+    timeout/parse/invalid/rounds/mode/status/api_error ("unknown" status
+    when the log is missing).
+    """
+    if output_log_path is None:
+        return {"timeout": 0, "parse": 0, "invalid": 0, "rounds": 0,
+                "mode": "ask", "status": "unknown", "api_error": ""}
+    entry = _get_manifest().get(str(output_log_path))
+    if entry is not None and entry.get("mtime") == output_log_path.stat().st_mtime:
+        defaults = {"timeout": 0, "parse": 0, "invalid": 0, "rounds": 0,
+                    "mode": "ask", "status": "unknown", "api_error": ""}
+        return {key: entry.get(key, default) for key, default in defaults.items()}
+    with open(output_log_path, "rb") as f:
+        return analyze_log_content(f.read())
+
+
+def analyze_log_content(content: bytes) -> dict:
+    """Pure scan of output.log bytes (via _scan_markers) into the metrics dict."""
+    out = {"timeout": 0, "parse": 0, "invalid": 0, "rounds": 0,
+           "mode": "ask", "status": "unknown", "api_error": ""}
+    counts, first = _scan_markers(content)
+    out["timeout"] = counts.get("timed out after", 0)
+    out["parse"] = counts.get("Could not parse", 0)
+    out["invalid"] = counts.get("❌ INVALID MOVE:", 0)
+    # run.sh logs both "=== ROUND N START ===" and "=== ROUND N COMPLETE ===",
+    # so count the START marker only — it appears exactly once per round.
+    out["rounds"] = counts.get(" START ===", 0)
+    # Mode: first of [agent mode] / [ask mode] wins, defaulting to ask
+    agent_at = first.get("[agent mode]", -1)
+    ask_at = first.get("[ask mode]", -1)
+    if agent_at != -1 and (ask_at == -1 or agent_at < ask_at):
+        out["mode"] = "agent"
+    m = _RE_API_ERROR.search(content)
+    if m:
+        out["api_error"] = m.group(1).decode("ascii", "replace")
+    if "GAME OVER" in first or "Board is full" in first:
+        out["status"] = "completed"
+    elif "Max rounds reached" in first:
+        out["status"] = "turn_limit"
+    elif "consecutive failures" in first:
+        out["status"] = "consecutive_failures"
+    else:
+        out["status"] = "interrupted"
+    return out
 
 
 def iter_experiments():
-    """Yield (benchmark_id, tool, exp_name, exp_dir) for each experiment."""
+    """Yield (benchmark_id, tool, exp_name, exp_dir) for each experiment.
+
+    os.scandir gives dirents with cached stat info, so is_dir() costs no
+    extra syscall per entry; per-file checks happen in process_experiment
+    from a single scandir of the experiment dir.
+
+    Yields in directory order: experiments stream straight into the worker
+    pool without materializing each listing, and main() sorts the output
+    rows explicitly anyway.
+    """
     if not BENCHMARKS_DIR.exists():
         return
-    for bm_dir in sorted(BENCHMARKS_DIR.iterdir()):
-        if not bm_dir.is_dir() or not bm_dir.name.startswith("benchmark_"):
+    for bm_entry in os.scandir(BENCHMARKS_DIR):
+        if not bm_entry.is_dir() or not bm_entry.name.startswith("benchmark_"):
             continue
-        bm_id = bm_dir.name
-        for tool_dir in sorted(bm_dir.iterdir()):
-            if not tool_dir.is_dir():
+        bm_id = bm_entry.name
+        for tool_entry in os.scandir(bm_entry.path):
+            if not tool_entry.is_dir():
                 continue
-            tool = tool_dir.name
-            for exp_dir in sorted(tool_dir.iterdir()):
-                if not exp_dir.is_dir():
-                    continue
-                if (exp_dir / "game.csv").exists() or (exp_dir / "final_board.txt").exists():
-                    yield bm_id, tool, exp_dir.name, exp_dir
+            tool = tool_entry.name
+            for exp_entry in os.scandir(tool_entry.path):
+                if exp_entry.is_dir():
+                    yield bm_id, tool, exp_entry.name, Path(exp_entry.path)
+
+
+ExpInfo = collections.namedtuple(
+    "ExpInfo", "tool model field_size timeout iteration turn_limit")
+
 
+@functools.lru_cache(maxsize=None)
+def parse_exp_name(name: str):
+    """Parse experiment dir name into an ExpInfo (None if it doesn't match).
 
-def parse_exp_name(name: str) -> dict:
-    """Parse experiment dir name into model, field_size, timeout, iteration, turn_limit."""
+    The name is fixed-delimiter, so split on '_' and validate tokens —
+    pure string ops, no regex backtracking. Pure over its input and the
+    same model/field/timeout combinations recur across benchmark dirs, so
+    results are memoized; the immutable namedtuple keeps callers from
+    mutating cached values.
+    """
     # e.g. claude_claude-opus-4-6_3x4_180s_i1_tunlimited  or  ..._t10_agent
-    m = re.match(r"^(claude|cursor)_(.+?)_(\d+x\d+)_(\d+)s_i(\d+)_t(.+)$", name)
-    if not m:
-        return {}
-    tool, model, field_size, timeout, iteration, turn_limit = m.groups()
+    parts = name.split("_")
+    # tool + model (>=1 token, may contain '_') + field + timeout + iter + turn limit
+    if len(parts) < 6 or parts[0] not in ("claude", "cursor"):
+        return None
+    # First token shaped like 3x4 ends the model (mirrors the old non-greedy match)
+    field_idx = 0
+    for i in range(2, len(parts) - 3):
+        left, sep, right = parts[i].partition("x")
+        if sep and left.isdigit() and right.isdigit():
+            field_idx = i
+            break
+    if not field_idx:
+        return None
+    timeout_tok = parts[field_idx + 1]  # e.g. 180s
+    iter_tok = parts[field_idx + 2]     # e.g. i1
+    tl_toks = parts[field_idx + 3:]     # e.g. ["tunlimited"] or ["t10", "agent"]
+    if (not timeout_tok.endswith("s") or not timeout_tok[:-1].isdigit()
+            or len(iter_tok) < 2 or not iter_tok.startswith("i")
+            or not iter_tok[1:].isdigit()
+            or len(tl_toks[0]) < 2 or not tl_toks[0].startswith("t")):
+        return None
+    turn_limit = "_".join(tl_toks)[1:]
     if turn_limit.endswith("_agent"):
         turn_limit = turn_limit[:-6]  # e.g. unlimited_agent -> unlimited
-    return {
-        "tool": tool,
-        "model": model,
-        "field_size": field_size,
-        "timeout": timeout,
-        "iteration": int(iteration),
-        "turn_limit": turn_limit,
-    }
+    return ExpInfo(parts[0], "_".join(parts[1:field_idx]), parts[field_idx],
+                   timeout_tok[:-1], int(iter_tok[1:]), turn_limit)
+
+
+def process_experiment(bm_id, tool, exp_name, exp_dir_str):
+    """Parse one experiment dir into a CSV row tuple (None if the name doesn't parse).
+
+    Pure function of its arguments so it can run in worker processes.
+    """
+    parsed = parse_exp_name(exp_name)
+    if parsed is None:
+        return None
+    # One scandir replaces the per-file .exists() stats in every helper.
+    with os.scandir(exp_dir_str) as it:
+        files = {e.name: Path(e.path) for e in it if e.is_file()}
+    if "game.csv" not in files and "final_board.txt" not in files:
+        return None
+
+    score = get_score(files.get("final_board.txt"))
+    word = get_initial_word(files)
+    words = get_words_list(files.get("final_board.txt"))
+    log = analyze_output_log(files.get("output.log"))
+    mode = log["mode"]
+    # Composer models run as agent; output.log may say "ask" for Cursor UI
+    if "composer" in parsed.model.lower():
+        mode = "agent"
+
+    # 10-turn: keep turn_limit as-is (e.g. "10" or "unlimited")
+    turn_limit = parsed.turn_limit
+
+    # Tuple in FIELDNAMES order: csv.writer serializes these without the
+    # per-row field lookups DictWriter does.
+    return (
+        parsed.model,
+        parsed.tool,
+        mode,
+        parsed.field_size,
+        turn_limit,
+        parsed.iteration,
+        score,
+        log["rounds"],
+        log["invalid"],
+        log["timeout"],
+        log["parse"],
+        log["api_error"],
+        word,
+        words,
+        log["status"],
+        bm_id,
+    )
 
 
 def main():
-    rows = []
-    for bm_id, tool, exp_name, exp_dir in iter_experiments():
-        parsed = parse_exp_name(exp_name)
-        if not parsed:
-            continue
-        output_log = exp_dir / "output.log"
-        final_board = exp_dir / "final_board.txt"
-
-        score = get_score(final_board)
-        word = get_initial_word(exp_dir)
-        words = get_words_list(exp_dir)
-        errs = count_errors(output_log)
-        rounds = count_rounds(output_log)
-        status = get_status(output_log)
-        mode = get_mode(output_log)
-        # Composer models run as agent; output.log may say "ask" for Cursor UI
-        if "composer" in parsed["model"].lower():
-            mode = "agent"
-
-        # 10-turn: keep turn_limit as-is (e.g. "10" or "unlimited")
-        turn_limit = parsed["turn_limit"]
-
-        rows.append({
-            "Model": parsed["model"],
-            "Tool": parsed["tool"],
-            "Mode": mode,
-            "Field size": parsed["field_size"],
-            "Turn limit": turn_limit,
-            "Iteration": parsed["iteration"],
-            "Score": score,
-            "Rounds": rounds,
-            "Invalid errors": errs["invalid"],
-            "Timeout errors": errs["timeout"],
-            "Parse errors": errs["parse"],
-            "Word": word,
-            "Words": words,
-            "Status": status,
-            "Benchmark": bm_id,
-        })
-
-    fieldnames = [
-        "Model", "Tool", "Mode", "Field size", "Turn limit", "Iteration",
-        "Score", "Rounds", "Invalid errors", "Timeout errors", "Parse errors",
-        "Word", "Words", "Status", "Benchmark",
-    ]
+    tasks = [(bm_id, tool, exp_name, str(exp_dir))
+             for bm_id, tool, exp_name, exp_dir in iter_experiments()]
+    # Experiments are independent (disk reads + regex), so fan out across cores.
+    # Module-level patterns are shared via fork, or compiled once per worker.
+    with ProcessPoolExecutor() as ex:
+        rows = [r for r in ex.map(process_experiment, *zip(*tasks), chunksize=16)
+                if r] if tasks else []
+
     with open(OUT_CSV, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        w.writerows(sorted(rows, key=lambda r: (r["Benchmark"], r["Tool"], r["Model"], r["Field size"], r["Iteration"])))
+        w = csv.writer(f)
+        w.writerow(FIELDNAMES)
+        # Benchmark, Tool, Model, Field size, Iteration
+        w.writerows(sorted(rows, key=operator.itemgetter(15, 1, 0, 3, 5)))
 
     print(f"Wrote {len(rows)} runs to {OUT_CSV}")
 
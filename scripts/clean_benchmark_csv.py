@@ -21,124 +21,178 @@ Keep:
 Output: benchmark_results_clean.csv
 """
 
-import csv
+import json
+import mmap
 import re
 from pathlib import Path
 
+import pandas as pd
+
 ROOT = Path(__file__).resolve().parent.parent
 INPUT = ROOT / "benchmark_results_runs.csv"
 OUTPUT = ROOT / "benchmark_results_clean.csv"
 BENCHMARKS_DIR = ROOT / "benchmarks"
-
-# Patterns indicating API/connection/rate-limit infrastructure errors in output.log
-API_ERROR_PATTERNS = [
-    re.compile(r"\[unavailable\]", re.IGNORECASE),
-    re.compile(r"ENOTFOUND", re.IGNORECASE),
-    re.compile(r"Connection stalled", re.IGNORECASE),
-    re.compile(r"\[resource_exhausted\]", re.IGNORECASE),
-    re.compile(r"getaddrinfo", re.IGNORECASE),
-]
+# Log-scan manifest written by scan_logs.py (consulted before opening logs)
+MANIFEST_PATH = ROOT / "benchmark_results_logscan.json"
+
+# API/connection/rate-limit infrastructure errors in output.log, as a single
+# alternation so one search pass covers all of them. Bytes pattern so it can
+# run directly over an mmap'd file without decoding it to str first.
+API_ERROR_RE = re.compile(
+    rb"(\[unavailable\]|ENOTFOUND|Connection stalled|\[resource_exhausted\]|getaddrinfo)",
+    re.IGNORECASE,
+)
+
+
+def build_experiment_index():
+    """Map (benchmark, tool) -> [(exp_dir_name, exp_dir)] with one scan per tool dir.
+
+    Built once up front so find_output_log doesn't re-walk the same
+    directories for every CSV row.
+    """
+    index = {}
+    if not BENCHMARKS_DIR.exists():
+        return index
+    for bm_dir in BENCHMARKS_DIR.iterdir():
+        if not bm_dir.is_dir():
+            continue
+        for tool_dir in bm_dir.iterdir():
+            if not tool_dir.is_dir():
+                continue
+            index[(bm_dir.name, tool_dir.name)] = [
+                (p.name, p) for p in tool_dir.iterdir() if p.is_dir()
+            ]
+    return index
 
 
-def find_output_log(row):
-    """Find the output.log for a given CSV row."""
+def find_output_log(row, index):
+    """Find the output.log for a given CSV row using the prebuilt index."""
     benchmark = row.get("Benchmark", "")
     tool = row.get("Tool", "")
-    if not benchmark or not tool:
-        return None
-    tool_dir = BENCHMARKS_DIR / benchmark / tool
-    if not tool_dir.exists():
-        return None
     # Match experiment dir by model, field, iteration
     model = row.get("Model", "")
     field = row.get("Field size", "")
     iteration = row.get("Iteration", "")
-    for exp_dir in tool_dir.iterdir():
-        if not exp_dir.is_dir():
-            continue
-        name = exp_dir.name
-        if model.replace(".", "-") in name and field in name and f"_i{iteration}_" in name:
+    model_key = model.replace(".", "-")
+    for name, exp_dir in index.get((benchmark, tool), []):
+        if model_key in name and field in name and f"_i{iteration}_" in name:
             log = exp_dir / "output.log"
             if log.exists():
                 return log
     return None
 
 
+# Scan results keyed by output.log path: several CSV rows can resolve to the
+# same log through the substring match, so never scan one file twice.
+_log_scan_cache = {}
+
+_manifest = None
+
+
+def _get_manifest():
+    """Lazy-load the scan_logs.py manifest ({} if absent)."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
 def has_api_errors(output_log_path):
     """Check if output.log contains API/connection/rate-limit errors."""
     if not output_log_path or not output_log_path.exists():
         return False, ""
-    with open(output_log_path) as f:
-        content = f.read()
-    for pattern in API_ERROR_PATTERNS:
-        matches = pattern.findall(content)
-        if matches:
-            return True, pattern.pattern
-    return False, ""
+    cached = _log_scan_cache.get(output_log_path)
+    if cached is not None:
+        return cached
+    # A current manifest entry already carries the API-error scan result
+    entry = _get_manifest().get(str(output_log_path))
+    if entry is not None and entry.get("mtime") == output_log_path.stat().st_mtime:
+        api = entry.get("api_error", "")
+        return bool(api), api
+    # mmap instead of f.read(): only the first match is needed, so the OS
+    # pages in just what the scan touches and no str copy is made.
+    result = (False, "")
+    with open(output_log_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                m = API_ERROR_RE.search(mm)
+                if m:
+                    result = (True, m.group(1).decode("ascii", "replace"))
+        except ValueError:  # empty file
+            pass
+    _log_scan_cache[output_log_path] = result
+    return result
 
 
 def main():
-    with open(INPUT, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        rows = list(reader)
+    # Columnar load: rules 1-4 become vectorized boolean masks over int
+    # columns instead of a per-row Python loop of dict lookups and casts.
+    df = pd.read_csv(INPUT, dtype=str, keep_default_na=False)
+    for col in ("Score", "Parse errors", "Timeout errors", "Rounds", "Invalid errors"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+    status = df["Status"].str.strip()
+    score = df["Score"]
+    parse = df["Parse errors"]
+    timeout = df["Timeout errors"]
+    rounds = df["Rounds"]
+
+    # Rule 1: interrupted
+    m_interrupted = status.eq("interrupted")
+    # Rule 2: high parse errors (markdown wrapping / technical issue)
+    m_parse = ~m_interrupted & parse.ge(100)
+    # Rule 3: Score = 0 (no valid moves)
+    m_score0 = ~m_interrupted & ~m_parse & score.eq(0)
+    pre = m_interrupted | m_parse | m_score0
+    # Rule 4: consecutive_failures from network/timeout issues
+    m_cf = ~pre & status.eq("consecutive_failures")
+    m_cf_gpt = m_cf & df["Model"].eq("gpt-5-3-codex-xhigh")
+    # timeouts >= 50% of rounds, without a division: 2*timeouts >= rounds
+    m_cf_to = m_cf & ~m_cf_gpt & rounds.gt(0) & (timeout * 2).ge(rounds)
+    discard = pre | m_cf_gpt | m_cf_to
+
+    # Rule 5: API/connection errors — only the rows that survived rules 1-4
+    # need checking. New CSVs carry the "API error" column; older ones fall
+    # back to the per-log scan.
+    if "API error" in df.columns:
+        api = df["API error"]
+    else:
+        index = build_experiment_index()
+        api = pd.Series("", index=df.index, dtype=object)
+        for i in df.index[~discard]:
+            log_path = find_output_log(df.loc[i].to_dict(), index)
+            has_errors, pattern = has_api_errors(log_path)
+            if has_errors:
+                api[i] = pattern
+    m_api = ~discard & api.ne("")
+    discard = discard | m_api
 
-    kept = []
+    # Per-row reason strings only for the (small) discarded set
     discarded_reasons = {}
-
-    for i, row in enumerate(rows, start=2):  # row 2 is first data row
-        status = row.get("Status", "").strip()
-        score = int(row.get("Score", "0"))
-        parse_errors = int(row.get("Parse errors", "0"))
-        timeout_errors = int(row.get("Timeout errors", "0"))
-        rounds = int(row.get("Rounds", "0"))
-        model = row.get("Model", "")
-
-        reason = None
-
-        # Rule 1: interrupted
-        if status == "interrupted":
+    for i in df.index[discard]:
+        if m_interrupted[i]:
             reason = "interrupted (incomplete data)"
-
-        # Rule 2: high parse errors (markdown wrapping / technical issue)
-        elif parse_errors >= 100:
-            reason = f"broken run ({parse_errors} parse errors)"
-
-        # Rule 3: Score = 0
-        elif score == 0:
+        elif m_parse[i]:
+            reason = f"broken run ({parse[i]} parse errors)"
+        elif m_score0[i]:
             reason = "Score=0 (no valid moves)"
-
-        # Rule 4: consecutive_failures from network/timeout issues
-        elif status == "consecutive_failures":
-            # gpt-5-3-codex-xhigh: entire model broken (all runs timeout-heavy)
-            if model == "gpt-5-3-codex-xhigh":
-                reason = f"timeout infrastructure failure ({model}, {timeout_errors} timeouts)"
-            # Timeout-dominated failures: timeouts >= 50% of rounds
-            elif rounds > 0 and timeout_errors / rounds >= 0.5:
-                reason = f"timeout-dominated failure ({timeout_errors}/{rounds} rounds timed out)"
-            # Otherwise: genuine model struggle (keep it)
-
-        # Rule 5: API/connection/rate-limit errors in output.log
-        if reason is None:
-            log_path = find_output_log(row)
-            has_errors, pattern = has_api_errors(log_path)
-            if has_errors:
-                reason = f"API/connection error ({pattern})"
-
-        if reason:
-            discarded_reasons.setdefault(reason, []).append(i)
+        elif m_cf_gpt[i]:
+            reason = f"timeout infrastructure failure ({df['Model'][i]}, {timeout[i]} timeouts)"
+        elif m_cf_to[i]:
+            reason = f"timeout-dominated failure ({timeout[i]}/{rounds[i]} rounds timed out)"
         else:
-            kept.append(row)
+            reason = f"API/connection error ({api[i]})"
+        discarded_reasons.setdefault(reason, []).append(i + 2)  # row 2 is first data row
 
-    # Write cleaned CSV
-    with open(OUTPUT, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(kept)
+    kept = df[~discard]
+    kept.to_csv(OUTPUT, index=False)
 
-    print(f"Input:     {len(rows)} runs")
+    print(f"Input:     {len(df)} runs")
     print(f"Kept:      {len(kept)} runs")
-    print(f"Discarded: {len(rows) - len(kept)} runs")
+    print(f"Discarded: {len(df) - len(kept)} runs")
     print()
     print("Discard breakdown:")
     for reason, row_nums in sorted(discarded_reasons.items()):
@@ -146,27 +200,23 @@ def main():
 
     print(f"\nWrote: {OUTPUT}")
 
-    # Summary stats for kept runs
+    # Summary stats for kept runs: grouped aggregation in pandas (C-level
+    # reductions) instead of Python-loop sums per group
     print("\n--- Kept runs summary ---")
-    by_model = {}
-    for row in kept:
-        key = (row["Model"], row["Tool"], row["Mode"], row["Field size"])
-        by_model.setdefault(key, []).append(row)
-
-    for key in sorted(by_model.keys()):
-        runs = by_model[key]
-        model, tool, mode, field = key
-        scores = [int(r["Score"]) for r in runs]
-        statuses = [r["Status"] for r in runs]
-        completed = sum(1 for s in statuses if s == "completed")
-        turn_limit = sum(1 for s in statuses if s == "turn_limit")
-        avg_score = sum(scores) / len(scores) if scores else 0
-        inv = sum(int(r["Invalid errors"]) for r in runs)
-        to = sum(int(r["Timeout errors"]) for r in runs)
-        pe = sum(int(r["Parse errors"]) for r in runs)
-        print(f"  {model:40s} {tool:8s} {mode:6s} {field:4s}  "
-              f"runs={len(runs):2d}  completed={completed:2d}  turn_limit={turn_limit:2d}  "
-              f"avg_score={avg_score:5.1f}  inv={inv:2d}  timeout={to:2d}  parse={pe:2d}")
+    if len(kept):
+        summary = kept.groupby(["Model", "Tool", "Mode", "Field size"]).agg(
+            runs=("Score", "size"),
+            completed=("Status", lambda s: (s == "completed").sum()),
+            turn_limit=("Status", lambda s: (s == "turn_limit").sum()),
+            avg_score=("Score", "mean"),
+            inv=("Invalid errors", "sum"),
+            timeout=("Timeout errors", "sum"),
+            parse=("Parse errors", "sum"),
+        )
+        for (model, tool, mode, field), r in summary.iterrows():
+            print(f"  {model:40s} {tool:8s} {mode:6s} {field:4s}  "
+                  f"runs={int(r.runs):2d}  completed={int(r.completed):2d}  turn_limit={int(r.turn_limit):2d}  "
+                  f"avg_score={r.avg_score:5.1f}  inv={int(r.inv):2d}  timeout={int(r.timeout):2d}  parse={int(r.parse):2d}")
 
 
 if __name__ == "__main__":
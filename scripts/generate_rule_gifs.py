@@ -15,9 +15,22 @@ Usage:
   python scripts/generate_rule_gifs.py
 """
 
+import argparse
+import functools
+import multiprocessing
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional accelerator
+    numba = None
+
 OUT_DIR = Path(__file__).resolve().parent.parent / "docs"
 
 # Layout
@@ -63,19 +76,56 @@ def load_fonts():
 FONT, SIDE_FONT, SMALL_FONT, BIG_FONT, WORD_FONT = load_fonts()
 
 
+def _measure_letter_offsets():
+    """In-cell centering offset per glyph, measured once with a throwaway
+    draw so tile baking never re-runs the FreeType metrics."""
+    probe = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    offsets = {}
+    for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        bb = probe.textbbox((0, 0), ch, font=FONT)
+        offsets[ch] = ((CELL - (bb[2] - bb[0])) // 2,
+                       (CELL - (bb[3] - bb[1])) // 2)
+    return offsets
+
+
+LETTER_OFFSET = _measure_letter_offsets()
+
+
+def _bake_letter_tiles():
+    """Render each letter once per text color onto a transparent CELL×CELL
+    tile. draw_board pastes these instead of shaping the glyph with
+    textbbox/text for every cell of every frame."""
+    dark, light = {}, {}
+    for ch, (tx, ty) in LETTER_OFFSET.items():
+        for fill, tiles in ((DARK, dark), ((255, 255, 255), light)):
+            tile = Image.new("RGBA", (CELL, CELL), (0, 0, 0, 0))
+            ImageDraw.Draw(tile).text((tx, ty), ch, fill=fill, font=FONT)
+            tiles[ch] = tile
+    return dark, light
+
+
+TILE_DARK, TILE_LIGHT = _bake_letter_tiles()
+
+
+# Shared immutable 5x5 base: AGENT in row 2 (0-indexed). Board state is a
+# small {(r, c): letter} overlay on top of this, so "copying" a board is a
+# dict copy of a few placed letters instead of a 5x5 list-of-lists clone.
+BASE_BOARD = (
+    (".", ".", ".", ".", "."),
+    (".", ".", ".", ".", "."),
+    ("A", "G", "E", "N", "T"),
+    (".", ".", ".", ".", "."),
+    (".", ".", ".", ".", "."),
+)
+
+
 def initial_board():
-    """5x5 board with AGENT in row 2 (0-indexed)."""
-    return [
-        [".", ".", ".", ".", "."],
-        [".", ".", ".", ".", "."],
-        ["A", "G", "E", "N", "T"],
-        [".", ".", ".", ".", "."],
-        [".", ".", ".", ".", "."],
-    ]
+    """Empty letter overlay over BASE_BOARD."""
+    return {}
 
 
 def copy_board(b):
-    return [row[:] for row in b]
+    return b.copy()
 
 
 def img_size():
@@ -84,69 +134,183 @@ def img_size():
     return w, h
 
 
-def cell_center(r, c, x0=PAD, y0=PAD):
-    return x0 + c * CELL + CELL // 2, y0 + r * CELL + CELL // 2
+IMG_W, IMG_H = img_size()
+SIDE_X = 5 * CELL + 2 * PAD + 16  # left edge of side-panel text
+
+
+# Cell centers are pure functions of the fixed layout; precompute them
+CELL_CENTERS = [[(PAD + c * CELL + CELL // 2, PAD + r * CELL + CELL // 2)
+                 for c in range(5)] for r in range(5)]
+
+
+def cell_center(r, c):
+    return CELL_CENTERS[r][c]
+
+
+# Cell background tiles (fill + 2px border) keyed by color pair. Rasterized
+# with NumPy slice assignment and built once per combination, so the per-cell
+# loop pastes a cached bitmap instead of issuing a draw.rectangle call.
+_CELL_TILE_CACHE = {}
+
+
+def _cell_tile(fill, border):
+    tile = _CELL_TILE_CACHE.get((fill, border))
+    if tile is None:
+        arr = np.empty((CELL, CELL, 3), dtype=np.uint8)
+        arr[:] = border
+        arr[2:-2, 2:-2] = fill
+        tile = Image.fromarray(arr)
+        _CELL_TILE_CACHE[(fill, border)] = tile
+    return tile
+
+
+# Compiled rasterizer tiers: the Cython extension (built via
+# scripts/setup.py build_ext --inplace) wins, then the numba JIT, then
+# draw_board's pure-PIL tile path.
+try:
+    from _render import rasterize_board as _rasterize_board
+except ImportError:
+    if numba is not None:
+        @numba.njit(parallel=True, cache=True)
+        def _rasterize_board(arr, fills, borders, cell):
+            """Fill each cell's interior and 2px border straight into arr."""
+            rows, cols = fills.shape[0], fills.shape[1]
+            for r in numba.prange(rows):
+                for c in range(cols):
+                    y0 = r * cell
+                    x0 = c * cell
+                    for y in range(cell):
+                        for x in range(cell):
+                            if 2 <= y < cell - 2 and 2 <= x < cell - 2:
+                                src = fills
+                            else:
+                                src = borders
+                            for k in range(3):
+                                arr[y0 + y, x0 + x, k] = src[r, c, k]
+    else:
+        _rasterize_board = None
 
 
-def draw_board(draw, board, x0=PAD, y0=PAD, highlights=None, path_cells=None,
-               new_letter_cell=None):
+def draw_board(img, draw, board, highlights=None, path_cells=None,
+               new_letter_cell=None, cells=None):
+    """Draw board cells; `board` is a letter overlay over BASE_BOARD and
+    `cells` restricts drawing to that subset (for delta-drawing on top of
+    a cached base frame)."""
     highlights = highlights or {}
     path_cells = path_cells or []
-    rows, cols = len(board), len(board[0])
-    for r in range(rows):
-        for c in range(cols):
-            x = x0 + c * CELL
-            y = y0 + r * CELL
-            ch = board[r][c]
-            if (r, c) in highlights:
-                fill = highlights[(r, c)]
-                border = _darken(fill, 30)
-            elif (r, c) == new_letter_cell:
-                fill = NEW_COLOR
-                border = _darken(NEW_COLOR, 30)
-            elif (r, c) in path_cells:
-                fill = PATH_COLOR
-                border = _darken(PATH_COLOR, 30)
-            elif ch == ".":
-                fill = EMPTY_FILL
-                border = EMPTY_BORDER
-            else:
-                fill = LETTER_FILL
-                border = LETTER_BORDER
-            draw.rectangle([x, y, x + CELL - 1, y + CELL - 1], fill=fill,
-                           outline=border, width=2)
-            if ch != ".":
-                bbox = draw.textbbox((0, 0), ch, font=FONT)
-                tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                tx = x + (CELL - tw) // 2
-                ty = y + (CELL - th) // 2
-                bright = fill in (ERROR_COLOR, PATH_COLOR, NEW_COLOR, YELLOW_COLOR)
-                text_color = (255, 255, 255) if bright else DARK
-                draw.text((tx, ty), ch, fill=text_color, font=FONT)
-
-    # Draw connector lines between consecutive path cells
+    rows, cols = len(BASE_BOARD), len(BASE_BOARD[0])
+    if cells is None:
+        cells = [(r, c) for r in range(rows) for c in range(cols)]
+
+    def cell_fill(r, c):
+        if (r, c) in highlights:
+            return highlights[(r, c)]
+        if (r, c) == new_letter_cell:
+            return NEW_COLOR
+        if (r, c) in path_cells:
+            return PATH_COLOR
+        if board.get((r, c), BASE_BOARD[r][c]) == ".":
+            return EMPTY_FILL
+        return LETTER_FILL
+
+    if _rasterize_board is not None and len(cells) == rows * cols:
+        # Full-board draw: one jitted pass over a contiguous buffer
+        # instead of a paste per cell.
+        fills = np.empty((rows, cols, 3), dtype=np.uint8)
+        borders = np.empty_like(fills)
+        for r, c in cells:
+            fill = cell_fill(r, c)
+            fills[r, c] = fill
+            borders[r, c] = BORDER_FOR.get(fill) or _darken(fill, 30)
+        arr = np.empty((rows * CELL, cols * CELL, 3), dtype=np.uint8)
+        _rasterize_board(arr, fills, borders, CELL)
+        img.paste(Image.fromarray(arr), (PAD, PAD))
+        backgrounds_done = True
+    else:
+        backgrounds_done = False
+
+    for r, c in cells:
+        x = PAD + c * CELL
+        y = PAD + r * CELL
+        ch = board.get((r, c), BASE_BOARD[r][c])
+        fill = cell_fill(r, c)
+        if not backgrounds_done:
+            border = BORDER_FOR.get(fill) or _darken(fill, 30)
+            img.paste(_cell_tile(fill, border), (x, y))
+        if ch != ".":
+            bright = fill in (ERROR_COLOR, PATH_COLOR, NEW_COLOR, YELLOW_COLOR)
+            tile = TILE_LIGHT[ch] if bright else TILE_DARK[ch]
+            img.paste(tile, (x, y), tile)
+
+    # Draw connector lines between consecutive path cells. Paths move in
+    # orthogonal unit steps, so the endpoint inset is just ±off along the
+    # step direction — all integer math, no normalization.
     if len(path_cells) >= 2:
+        off = CELL // 2 - 4
         for i in range(len(path_cells) - 1):
-            cx1, cy1 = cell_center(*path_cells[i], x0, y0)
-            cx2, cy2 = cell_center(*path_cells[i + 1], x0, y0)
-            dx, dy = cx2 - cx1, cy2 - cy1
-            mag = max(abs(dx), abs(dy))
-            if mag == 0:
-                continue
-            ux, uy = dx / mag, dy / mag
-            sx = cx1 + ux * (CELL // 2 - 4)
-            sy = cy1 + uy * (CELL // 2 - 4)
-            ex = cx2 - ux * (CELL // 2 - 4)
-            ey = cy2 - uy * (CELL // 2 - 4)
-            draw.line([(sx, sy), (ex, ey)], fill=(100, 100, 100), width=2)
+            (pr1, pc1), (pr2, pc2) = path_cells[i], path_cells[i + 1]
+            cx1, cy1 = CELL_CENTERS[pr1][pc1]
+            cx2, cy2 = CELL_CENTERS[pr2][pc2]
+            dr, dc = pr2 - pr1, pc2 - pc1
+            draw.line([(cx1 + dc * off, cy1 + dr * off),
+                       (cx2 - dc * off, cy2 - dr * off)],
+                      fill=(100, 100, 100), width=2)
 
 
 def _darken(color, amount):
     return tuple(max(0, c - amount) for c in color)
 
 
-def draw_side_panel(draw, x0, y0, word_list=None, current_word=None,
-                    current_word_color=DARK, status=None, status_color=DARK):
+# Fill -> border color, precomputed so the per-cell loop never re-derives it
+BORDER_FOR = {
+    EMPTY_FILL: EMPTY_BORDER,
+    LETTER_FILL: LETTER_BORDER,
+    PATH_COLOR: _darken(PATH_COLOR, 30),
+    NEW_COLOR: _darken(NEW_COLOR, 30),
+    ERROR_COLOR: _darken(ERROR_COLOR, 30),
+    YELLOW_COLOR: _darken(YELLOW_COLOR, 30),
+}
+
+
+def _build_palette():
+    """One shared GIF palette: the flat fills are exact entries and the
+    anti-aliased glyph edges land on grey/blend ramps, so quantizing
+    against it skips per-frame median-cut with near-lossless output."""
+    colors = [
+        BG, EMPTY_FILL, EMPTY_BORDER, LETTER_FILL, LETTER_BORDER,
+        PATH_COLOR, NEW_COLOR, ERROR_COLOR, YELLOW_COLOR, MUTED, DARK,
+        (255, 255, 255), (0, 0, 0),
+        (100, 100, 100),   # connector lines
+        (120, 80, 80),     # gif6 wrong-output text
+        (255, 242, 240),   # gif6 rejected-frame background
+    ]
+    colors += [_darken(c, 30) for c in
+               (PATH_COLOR, NEW_COLOR, ERROR_COLOR, YELLOW_COLOR)]
+    # Grey ramp for anti-aliased dark glyph edges on light fills
+    colors += [(g, g, g) for g in range(16, 255, 16)]
+    # White glyphs on colored cells anti-alias toward the cell fill; give
+    # each accent color a white->fill ramp so those edge pixels land on a
+    # nearby blend instead of the closest neutral grey.
+    for accent in (PATH_COLOR, NEW_COLOR, ERROR_COLOR, YELLOW_COLOR):
+        colors += [tuple(round(255 + (ch - 255) * t / 8) for ch in accent)
+                   for t in range(1, 8)]
+    flat = []
+    seen = set()
+    for c in colors:
+        if c not in seen:
+            seen.add(c)
+            flat.extend(c)
+    img = Image.new("P", (1, 1))
+    img.putpalette(flat + [0] * (768 - len(flat)))
+    return img
+
+
+_PALETTE_IMG = _build_palette()
+
+
+def draw_word_list_only(draw, x0, y0, word_list):
+    """Paint the "Words:" column; returns the y below the list so
+    draw_side_panel can continue underneath it."""
     y = y0
     draw.text((x0, y), "Words:", fill=MUTED, font=SIDE_FONT)
     y += 24
@@ -157,7 +321,12 @@ def draw_side_panel(draw, x0, y0, word_list=None, current_word=None,
     else:
         draw.text((x0 + 4, y), "(none)", fill=MUTED, font=SMALL_FONT)
         y += 22
+    return y
+
 
+def draw_side_panel(draw, x0, y0, word_list=None, current_word=None,
+                    current_word_color=DARK, status=None, status_color=DARK):
+    y = draw_word_list_only(draw, x0, y0, word_list)
     y += 16
     if current_word is not None:
         draw.text((x0, y), "Current:", fill=MUTED, font=SIDE_FONT)
@@ -172,38 +341,142 @@ def draw_side_panel(draw, x0, y0, word_list=None, current_word=None,
             y += 24
 
 
-def make_frame(board, word_list=None, current_word=None,
-               current_word_color=DARK, status=None, status_color=DARK,
-               highlights=None, path_cells=None, new_letter_cell=None,
-               extra_draw=None, img_w=None, img_h=None):
-    if img_w is None or img_h is None:
-        img_w, img_h = img_size()
-    img = Image.new("RGB", (img_w, img_h), BG)
-    d = ImageDraw.Draw(img)
-    draw_board(d, board, highlights=highlights, path_cells=path_cells,
-               new_letter_cell=new_letter_cell)
-    side_x = 5 * CELL + 2 * PAD + 16
-    draw_side_panel(d, side_x, PAD, word_list=word_list,
+@functools.lru_cache(maxsize=256)
+def _render_side_panel(word_list_key, current_word, current_word_color,
+                       status, status_color):
+    """Side-panel strip rendered once per distinct content tuple; the few
+    panel states recur across many frames, so make_frame pastes a cached
+    strip instead of re-rasterizing the same text every frame."""
+    panel = Image.new("RGB", (IMG_W - (SIDE_X - 16), IMG_H), BG)
+    draw_side_panel(ImageDraw.Draw(panel), 16, PAD,
+                    word_list=list(word_list_key),
                     current_word=current_word,
                     current_word_color=current_word_color,
                     status=status, status_color=status_color)
+    return panel
+
+
+def _canvas_template():
+    """BG canvas with the all-empty grid pre-painted, kept as a NumPy
+    array. New base frames start as one fromarray copy of this template
+    and only paint the lettered cells, instead of clearing and drawing
+    all 25 cells per board state."""
+    img = Image.new("RGB", (IMG_W, IMG_H), BG)
+    rows, cols = len(BASE_BOARD), len(BASE_BOARD[0])
+    all_empty = {(r, c): "." for r in range(rows) for c in range(cols)}
+    draw_board(img, ImageDraw.Draw(img), all_empty)
+    return np.array(img)
+
+
+_CANVAS_TEMPLATE = _canvas_template()
+
+# Fully-drawn background + quiet board per board state, rendered once and
+# copied per frame; make_frame then only draws the dynamic cells on top.
+_BASE_CACHE = {}
+
+
+def _base_frame(board):
+    key = tuple(sorted(board.items()))
+    base = _BASE_CACHE.get(key)
+    if base is None:
+        base = Image.fromarray(_CANVAS_TEMPLATE)
+        rows, cols = len(BASE_BOARD), len(BASE_BOARD[0])
+        lettered = [(r, c) for r in range(rows) for c in range(cols)
+                    if board.get((r, c), BASE_BOARD[r][c]) != "."]
+        draw_board(base, ImageDraw.Draw(base), board, cells=lettered)
+        _BASE_CACHE[key] = base
+    return base.copy()
+
+
+def make_frame(board, word_list=None, current_word=None,
+               current_word_color=DARK, status=None, status_color=DARK,
+               highlights=None, path_cells=None, new_letter_cell=None,
+               extra_draw=None, base_img=None, delta_cells=None):
+    if base_img is not None:
+        # Incremental render: copy the previous frame and repaint only
+        # delta_cells (plus connectors, which are idempotent) and the
+        # side panel, instead of rebuilding the board from the base.
+        img = base_img.copy()
+        d = ImageDraw.Draw(img)
+        draw_board(img, d, board, highlights=highlights, path_cells=path_cells,
+                   new_letter_cell=new_letter_cell, cells=delta_cells or ())
+    else:
+        img = _base_frame(board)
+        d = ImageDraw.Draw(img)
+        # Only the highlighted/path/new cells differ from the cached base
+        dynamic = set(highlights or ())
+        dynamic.update(path_cells or ())
+        if new_letter_cell is not None:
+            dynamic.add(new_letter_cell)
+        if dynamic:
+            draw_board(img, d, board, highlights=highlights, path_cells=path_cells,
+                       new_letter_cell=new_letter_cell, cells=dynamic)
+    # The pasted strip covers the whole panel region, so the incremental
+    # branch needs no explicit clear.
+    img.paste(_render_side_panel(tuple(word_list or ()), current_word,
+                                 current_word_color, status, status_color),
+              (SIDE_X - 16, 0))
     if extra_draw:
         extra_draw(d, img)
     return img
 
 
-def repeat_frame(frame, count):
-    return [frame.copy() for _ in range(count)]
+def save_gif(pairs, path, fmt="gif"):
+    """Encode an iterable of (frame, duration) pairs.
+
+    The iterable is consumed lazily and runs of the same frame coalesce
+    into one frame with a summed duration as they stream past; only the
+    coalesced frames are materialized, since Pillow's animated writers
+    need the full append_images list (true frame-at-a-time streaming
+    would require something like imageio)."""
+    out_frames = []
+    out_durations = []
+    for frame, duration in pairs:
+        if out_frames and frame is out_frames[-1]:
+            out_durations[-1] += duration
+        else:
+            out_frames.append(frame)
+            out_durations.append(duration)
+    if fmt == "webp":
+        # Lossless WebP: flat colors and small deltas compress far better
+        # than GIF's palette+LZW, and no quantize pass is needed.
+        path = path.with_suffix(".webp")
+        out_frames[0].save(
+            path, save_all=True, append_images=out_frames[1:],
+            duration=out_durations, loop=0, lossless=True, method=6,
+        )
+    else:
+        # Map everything onto the shared global palette once, so the encoder
+        # writes a single color table instead of quantizing each frame.
+        out_frames = [
+            f.quantize(palette=_PALETTE_IMG, dither=Image.Dither.NONE)
+            if f.mode != "P" else f
+            for f in out_frames
+        ]
+        out_frames[0].save(
+            path, save_all=True, append_images=out_frames[1:],
+            duration=out_durations, loop=0, optimize=True, disposal=2,
+        )
+        _gifsicle_pass(path)
+    print(f"  Wrote {path} ({len(out_frames)} frames)")
 
 
-def save_gif(frames, durations, path):
-    if isinstance(durations, int):
-        durations = [durations] * len(frames)
-    frames[0].save(
-        path, save_all=True, append_images=frames[1:],
-        duration=durations, loop=0,
-    )
-    print(f"  Wrote {path} ({len(frames)} frames)")
+_GIFSICLE = shutil.which("gifsicle")
+
+
+def _gifsicle_pass(path):
+    """Re-optimize the saved GIF in place with gifsicle when available.
+
+    Pillow's encoder leaves a lot on the table (no frame-diff cropping or
+    transparency reuse); gifsicle -O3 typically halves the file. Purely a
+    post-pass, so missing gifsicle just keeps the Pillow output."""
+    if not _GIFSICLE:
+        return
+    try:
+        subprocess.run([_GIFSICLE, "-O3", str(path), "-o", str(path)],
+                       check=True, capture_output=True)
+    except subprocess.CalledProcessError:
+        pass  # keep the Pillow-encoded file
 
 
 # ─── Standard turns used across GIFs ─────────────────────────────────────
@@ -249,17 +522,20 @@ def animate_turn(board, turn, word_list, is_error=False):
 
     # Step 2: place letter
     r, c = new_cell
-    board[r][c] = new_letter
+    board[new_cell] = new_letter
     frames.append(make_frame(board, word_list=word_list,
                              new_letter_cell=new_cell))
     durations.append(500)
 
-    # Step 3: animate path cell by cell, building word
+    # Step 3: animate path cell by cell, building word. Each frame extends
+    # the previous one by a single cell, so render on top of it instead of
+    # rebuilding the whole board.
     for i in range(1, len(path) + 1):
         frames.append(make_frame(
             board, word_list=word_list,
             current_word=word[:i], current_word_color=PATH_COLOR,
             path_cells=path[:i], new_letter_cell=new_cell,
+            base_img=frames[-1], delta_cells=(path[i - 1],),
         ))
         durations.append(350)
 
@@ -273,8 +549,8 @@ def animate_turn(board, turn, word_list, is_error=False):
             status="✗ INVALID", status_color=ERROR_COLOR,
             highlights=err_hl,
         )
-        frames.extend(repeat_frame(err_frame, 20))
-        durations.extend([FRAME_MS] * 20)
+        frames.append(err_frame)
+        durations.append(FRAME_MS * 20)
     else:
         ok_frame = make_frame(
             board, word_list=word_list,
@@ -282,37 +558,53 @@ def animate_turn(board, turn, word_list, is_error=False):
             status="✓ Valid", status_color=VALID_COLOR,
             path_cells=path, new_letter_cell=new_cell,
         )
-        frames.extend(repeat_frame(ok_frame, 6))
-        durations.extend([FRAME_MS] * 6)
+        frames.append(ok_frame)
+        durations.append(FRAME_MS * 6)
 
         word_list = list(word_list or [])
         word_list.append((word, VALID_COLOR))
-        frames.append(make_frame(board, word_list=word_list))
+        # The quiet board is already cached; just paint the updated list
+        # instead of a full make_frame render.
+        img = _base_frame(board)
+        draw_word_list_only(ImageDraw.Draw(img), SIDE_X, PAD, word_list)
+        frames.append(img)
         durations.append(600)
 
     return frames, durations, board, word_list
 
 
-def two_valid_turns(board):
+# gif1-gif5 all open with the same RAGE+DENT animation; render it once per
+# process and hand out copies of the mutable containers (frames themselves
+# are never mutated after creation).
+_PREFIX_CACHE = None
+
+
+def two_valid_turns():
     """Run standard two valid turns (RAGE, DENT). Returns frames, durations, board, word_list."""
-    frames = []
-    durations = []
-    word_list = []
+    global _PREFIX_CACHE
+    if _PREFIX_CACHE is None:
+        frames = []
+        durations = []
+        board = initial_board()
+        word_list = []
 
-    f, d, board, word_list = animate_turn(board, TURN1, word_list)
-    frames += f; durations += d
+        f, d, board, word_list = animate_turn(board, TURN1, word_list)
+        frames += f; durations += d
 
-    f, d, board, word_list = animate_turn(board, TURN2, word_list)
-    frames += f; durations += d
+        f, d, board, word_list = animate_turn(board, TURN2, word_list)
+        frames += f; durations += d
 
-    return frames, durations, board, word_list
+        _PREFIX_CACHE = (frames, durations, board, word_list)
+
+    frames, durations, board, word_list = _PREFIX_CACHE
+    return list(frames), list(durations), copy_board(board), list(word_list)
 
 
 # ─── GIF 1: Single Letter Placement ──────────────────────────────────────
 
 def gif1():
     """One letter per turn, must be placed on an empty cell."""
-    frames, durations, board, word_list = two_valid_turns(initial_board())
+    frames, durations, board, word_list = two_valid_turns()
 
     # Turn 3 (invalid): try to place on (2,2) which already has E
     board_copy = copy_board(board)
@@ -324,22 +616,22 @@ def gif1():
     err_frame = make_frame(board_copy, word_list=word_list,
                            highlights={(2, 2): ERROR_COLOR},
                            status="✗ Cell occupied!", status_color=ERROR_COLOR)
-    frames.extend(repeat_frame(err_frame, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(err_frame)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif1_letter_placement.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif1_letter_placement.gif"
 
 
 # ─── GIF 2: Word Path Must Include New Letter ────────────────────────────
 
 def gif2():
     """New letter must be part of the word path."""
-    frames, durations, board, word_list = two_valid_turns(initial_board())
+    frames, durations, board, word_list = two_valid_turns()
 
     # Turn 3 (invalid): Place T at (4,3), try to claim word TENT
     # TENT needs path through E(2,2)→N(2,3)→T(2,4) — new T at (4,3) NOT in path
     board_inv = copy_board(board)
-    board_inv[4][3] = "T"
+    board_inv[(4, 3)] = "T"
 
     frames.append(make_frame(board_inv, word_list=word_list,
                              new_letter_cell=(4, 3)))
@@ -354,6 +646,7 @@ def gif2():
             board_inv, word_list=word_list,
             current_word="T" + word_letters[:i], current_word_color=PATH_COLOR,
             path_cells=bad_path[:i], new_letter_cell=(4, 3),
+            base_img=frames[-1], delta_cells=(bad_path[i - 1],),
         ))
         durations.append(300)
 
@@ -365,21 +658,21 @@ def gif2():
         status="✗ New letter not\nin path!", status_color=ERROR_COLOR,
         highlights=err_hl,
     )
-    frames.extend(repeat_frame(err_frame, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(err_frame)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif2_path_must_include_letter.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif2_path_must_include_letter.gif"
 
 
 # ─── GIF 3: No Diagonal Movement ─────────────────────────────────────────
 
 def gif3():
     """Path must use orthogonal (up/down/left/right) steps only."""
-    frames, durations, board, word_list = two_valid_turns(initial_board())
+    frames, durations, board, word_list = two_valid_turns()
 
     # Turn 3 (invalid): Place K at (3,1), attempt diagonal to E(2,2)
     board_inv = copy_board(board)
-    board_inv[3][1] = "K"
+    board_inv[(3, 1)] = "K"
 
     frames.append(make_frame(board_inv, word_list=word_list,
                              new_letter_cell=(3, 1)))
@@ -408,22 +701,22 @@ def gif3():
         highlights={(3, 1): ERROR_COLOR, (2, 2): ERROR_COLOR},
         extra_draw=draw_diagonal_line,
     )
-    frames.extend(repeat_frame(err_frame, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(err_frame)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif3_no_diagonal.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif3_no_diagonal.gif"
 
 
 # ─── GIF 4: No Cell Reuse ────────────────────────────────────────────────
 
 def gif4():
     """Each cell can only be visited once in a path."""
-    frames, durations, board, word_list = two_valid_turns(initial_board())
+    frames, durations, board, word_list = two_valid_turns()
 
     # Turn 3 (invalid): Place O at (3,1), attempt O→G→E→G (revisit G at (2,1))
     # Path: O(3,1)→G(2,1)→E(2,2)→G(2,1) — (2,1) visited twice!
     board_inv = copy_board(board)
-    board_inv[3][1] = "O"
+    board_inv[(3, 1)] = "O"
 
     frames.append(make_frame(board_inv, word_list=word_list,
                              new_letter_cell=(3, 1)))
@@ -435,6 +728,7 @@ def gif4():
             board_inv, word_list=word_list,
             current_word="OGE"[:i], current_word_color=PATH_COLOR,
             path_cells=attempt_path[:i], new_letter_cell=(3, 1),
+            base_img=frames[-1], delta_cells=(attempt_path[i - 1],),
         ))
         durations.append(400)
 
@@ -446,22 +740,22 @@ def gif4():
         status="✗ Cell already\nvisited!", status_color=ERROR_COLOR,
         highlights=err_hl,
     )
-    frames.extend(repeat_frame(err_frame, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(err_frame)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif4_no_cell_reuse.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif4_no_cell_reuse.gif"
 
 
 # ─── GIF 5: No Repeated Words ────────────────────────────────────────────
 
 def gif5():
     """A word that was already used cannot be submitted again."""
-    frames, durations, board, word_list = two_valid_turns(initial_board())
+    frames, durations, board, word_list = two_valid_turns()
 
     # Turn 3 (invalid): Place E at (3,1), attempt RAGE again
     # Path: R(1,0)→A(2,0)→G(2,1)→E(3,1) — all orthogonal, but RAGE already used!
     board_inv = copy_board(board)
-    board_inv[3][1] = "E"
+    board_inv[(3, 1)] = "E"
     dup_path = [(1, 0), (2, 0), (2, 1), (3, 1)]
 
     frames.append(make_frame(board_inv, word_list=word_list,
@@ -473,6 +767,7 @@ def gif5():
             board_inv, word_list=word_list,
             current_word="RAGE"[:i], current_word_color=PATH_COLOR,
             path_cells=dup_path[:i], new_letter_cell=(3, 1),
+            base_img=frames[-1], delta_cells=(dup_path[i - 1],),
         ))
         durations.append(350)
 
@@ -486,10 +781,10 @@ def gif5():
         status="✗ Already used!", status_color=ERROR_COLOR,
         highlights=err_hl,
     )
-    frames.extend(repeat_frame(err_frame, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(err_frame)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif5_no_repeated_words.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif5_no_repeated_words.gif"
 
 
 # ─── GIF 6: Format Failure ───────────────────────────────────────────────
@@ -551,25 +846,46 @@ def gif6():
     d3.line([(img_w - 30, 30), (30, 210)], fill=ERROR_COLOR, width=4)
     d3.text((20, 240), "Parse failure → move skipped",
             fill=ERROR_COLOR, font=SIDE_FONT)
-    frames.extend(repeat_frame(img3, 20))
-    durations.extend([FRAME_MS] * 20)
+    frames.append(img3)
+    durations.append(FRAME_MS * 20)
 
-    save_gif(frames, durations, OUT_DIR / "gif6_format_failure.gif")
+    return list(zip(frames, durations)), OUT_DIR / "gif6_format_failure.gif"
 
 
 # ─── Main ────────────────────────────────────────────────────────────────
 
-def main():
+def _build_gif(f):
+    return f()
+
+
+def main(fmt="gif"):
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     print("Generating rule illustration GIFs...")
-    gif1()
-    gif2()
-    gif3()
-    gif4()
-    gif5()
-    gif6()
+    # Warm the shared RAGE+DENT opening (and the base-frame cache it
+    # fills) before the pool exists, so forked workers inherit the
+    # rendered prefix instead of each starting with a cold cache.
+    two_valid_turns()
+    # The six GIFs are independent CPU-bound work; render them in parallel.
+    # Fonts/tiles/palette are rebuilt per worker via the module-level init.
+    # Encoding happens on a single writer thread here, so a finished GIF's
+    # save overlaps the pool still building the remaining ones (the LZW
+    # encode releases the GIL inside PIL).
+    with multiprocessing.Pool(6) as pool, \
+            ThreadPoolExecutor(max_workers=1) as writer:
+        saves = [
+            writer.submit(save_gif, pairs, path, fmt)
+            for pairs, path in pool.imap_unordered(
+                _build_gif, [gif1, gif2, gif3, gif4, gif5, gif6])
+        ]
+        for s in saves:
+            s.result()
     print("Done! All GIFs saved to", OUT_DIR)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--format", choices=("gif", "webp"), default="gif",
+        help="output format; webp is lossless and much smaller, but any "
+             "docs embedding the images must switch to the .webp extension")
+    main(parser.parse_args().format)
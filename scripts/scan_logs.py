@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Scan every output.log under benchmarks/ once and cache the extracted metrics.
+
+Writes benchmark_results_logscan.json keyed by output.log path, with the
+file's mtime stored per entry for invalidation. build_runs_csv.py and
+clean_benchmark_csv.py consume the manifest instead of re-reading logs, so
+the expensive parse happens once for the whole pipeline. Re-running only
+rescans logs whose mtime changed.
+
+Usage:
+  python scripts/scan_logs.py
+"""
+import json
+
+from build_runs_csv import MANIFEST_PATH, analyze_output_log, iter_experiments
+
+
+def main():
+    manifest = {}
+    for bm_id, tool, exp_name, exp_dir in iter_experiments():
+        log = exp_dir / "output.log"
+        if not log.exists():
+            continue
+        # analyze_output_log reuses current entries from the previous
+        # manifest (mtime-checked), so unchanged logs aren't re-read.
+        metrics = analyze_output_log(log)
+        metrics["mtime"] = log.stat().st_mtime
+        manifest[str(log)] = metrics
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    print(f"Scanned {len(manifest)} logs into {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
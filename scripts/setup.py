@@ -0,0 +1,8 @@
+"""Build the optional Cython rasterizer used by generate_rule_gifs.py:
+
+  cd scripts && python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(ext_modules=cythonize("_render.pyx", language_level=3))